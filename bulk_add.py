@@ -5,7 +5,6 @@ from collections.abc import Sequence
 
 from anki.collection import Collection, OpChanges
 from anki.notes import Note, NoteId
-from aqt import mw
 from aqt.browser import Browser
 from aqt.operations import CollectionOp
 from aqt.qt import *
@@ -32,7 +31,7 @@ def update_notes_op(col: Collection, notes: Sequence[Note]) -> OpChanges:
 def bulk_add_readings(nids: Sequence[NoteId], parent: Browser) -> None:
     CollectionOp(
         parent=parent,
-        op=lambda col: update_notes_op(col, notes=[mw.col.get_note(nid) for nid in nids]),
+        op=lambda col: update_notes_op(col, notes=[col.get_note(nid) for nid in nids]),
     ).success(
         lambda out: showInfo(
             parent=parent,
@@ -1,10 +1,15 @@
 # Copyright: Ren Tatsumoto <tatsu at autistici.org>
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
+import functools
+import itertools
+
 try:
-    from ..mecab_controller.kana_conv import is_kana_str, to_katakana as _
+    from ..mecab_controller.kana_conv import is_kana_str, to_katakana
 except ImportError:
-    from mecab_controller.kana_conv import is_kana_str, to_katakana as _
+    from mecab_controller.kana_conv import is_kana_str, to_katakana
+
+_ = functools.lru_cache(maxsize=4096)(to_katakana)
 
 
 def adjust_to_inflection(raw_word: str, headword: str, headword_reading: str) -> str:
@@ -12,9 +17,10 @@ def adjust_to_inflection(raw_word: str, headword: str, headword_reading: str) ->
     Adjusts the word's reading to match its conjugated form.
     E.g., if raw_word is 食べた and the reading is たべる, it should output たべた.
     """
-    if _(headword) == _(headword_reading):
+    kata_headword, kata_reading = _(headword), _(headword_reading)
+    if kata_headword == kata_reading:
         return raw_word
-    if _(headword) == _(raw_word):
+    if kata_headword == _(raw_word):
         return headword_reading
     if is_kana_str(raw_word):
         return raw_word
@@ -23,14 +29,18 @@ def adjust_to_inflection(raw_word: str, headword: str, headword_reading: str) ->
     # Go from the last to the first character
     # and skip the characters that are identical between the headword and the reading.
     # In the end, the reading of a common `stem` should be found, e.g. "ひざまず" for "跪かなかった"
-    idx_headword, idx_reading = len(headword), len(headword_reading)
-    while _(headword[idx_headword - 1]) == _(headword_reading[idx_reading - 1]):
-        idx_headword -= 1
-        idx_reading -= 1
+    common = sum(
+        1
+        for _pair in itertools.takewhile(
+            lambda pair: pair[0] == pair[1],
+            zip(reversed(kata_headword), reversed(kata_reading)),
+        )
+    )
+    idx_headword, idx_reading = len(headword) - common, len(headword_reading) - common
     stem_reading = headword_reading[:idx_reading]
     inflected_reading = raw_word[idx_headword:]
 
-    if _(stem_reading) == _(headword_reading):
+    if _(stem_reading) == kata_reading:
         return headword_reading
     return stem_reading + inflected_reading
 
@@ -17,11 +17,13 @@ THIS_ADDON_MODULE = __name__.split(".")[0]
 
 
 def walk_parents(current_dir: str) -> Iterable[str]:
-    while not os.path.samefile(parent_dir := os.path.dirname(current_dir), current_dir):
+    current_dir = os.path.abspath(current_dir)
+    while (parent_dir := os.path.dirname(current_dir)) != current_dir:
         yield parent_dir
         current_dir = parent_dir
 
 
+@functools.cache
 def resolve_relative_path(*paths) -> str:
     """Return path to file inside the add-on's dir."""
     for parent_dir in walk_parents(__file__):
@@ -34,6 +36,7 @@ def touch(path):
         os.utime(path, None)
 
 
+@functools.cache
 def find_config_json() -> str:
     """Used when testing/debugging."""
     for parent_dir in walk_parents(__file__):
@@ -1,12 +1,13 @@
 # Copyright: Ren Tatsumoto <tatsu at autistici.org>
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
-import io
 import re
 from collections.abc import Iterable
 from typing import NamedTuple, Final, Union
 
 MULTIPLE_READING_SEP: Final[str] = "・"
+RE_NON_JP_FURIGANA: Final[re.Pattern] = re.compile(r"\[[^ぁ-ゖァ-ヺｧ-ﾝ]+]")
+RE_FURIGANA_BRACKETS: Final[re.Pattern] = re.compile(r"\[[^\[\]]+?]")
 
 
 class SplitFurigana(NamedTuple):
@@ -31,7 +32,7 @@ class WordReading(NamedTuple):
 
 def strip_non_jp_furigana(expr: str) -> str:
     """Non-japanese furigana is not real furigana. Strip it."""
-    return re.sub(r"\[[^ぁ-ゖァ-ヺｧ-ﾝ]+]", "", expr)
+    return RE_NON_JP_FURIGANA.sub("", expr)
 
 
 def find_head_reading_suffix(text: str) -> Union[SplitFurigana, NoFurigana]:
@@ -39,13 +40,8 @@ def find_head_reading_suffix(text: str) -> Union[SplitFurigana, NoFurigana]:
     Locate where furigana starts and ends, return the three parts.
     Return text back if it doesn't contain furigana.
     """
-    furigana_start, furigana_end = -1, -1
-    for i, c in enumerate(text):
-        if c == "[":
-            furigana_start = i
-        if c == "]":
-            furigana_end = i
-            break
+    furigana_end = text.find("]")
+    furigana_start = text.rfind("[", 0, furigana_end)
     if 0 < furigana_start < furigana_end:
         return SplitFurigana(text[:furigana_start], text[furigana_start + 1 : furigana_end], text[furigana_end + 1 :])
     else:
@@ -66,21 +62,23 @@ def decompose_word(text: str) -> SplitFurigana:
     "辛[から]い" == (head='辛', reading='から', suffix='い')
     "南[みなみ]千[ち]秋[あき]" == (head='南千秋', reading='みなみちあき', suffix='')
     """
-    head, reading, suffix = io.StringIO(), io.StringIO(), io.StringIO()
+    head: list[str] = []
+    reading: list[str] = []
+    suffix: list[str] = []
     for num, part in enumerate(iter_split_parts(text)):
         if isinstance(part, NoFurigana) and num > 0:
-            suffix.write(part)
+            suffix.append(part)
         else:
-            head.write(part.head)
-            reading.write(part.reading)
-    return SplitFurigana(head.getvalue(), reading.getvalue(), suffix.getvalue())
+            head.append(part.head)
+            reading.append(part.reading)
+    return SplitFurigana("".join(head), "".join(reading), "".join(suffix))
 
 
 def tie_inside_furigana(s: str) -> str:
     def fixup(m: re.Match):
         return m.group().replace(" ", MULTIPLE_READING_SEP)
 
-    return re.sub(r"\[[^\[\]]+?]", fixup, s)
+    return RE_FURIGANA_BRACKETS.sub(fixup, s)
 
 
 def whitespace_split(furigana_notation: str) -> list[str]:
@@ -90,15 +88,47 @@ def whitespace_split(furigana_notation: str) -> list[str]:
     return tie_inside_furigana(furigana_notation).split()
 
 
+def _parse_notation(text: str) -> tuple[str, str]:
+    """
+    Same as running decompose_word on every chunk of whitespace_split(text), in one pass.
+    Spaces are tied inside a bracket pair that contains no other brackets.
+    A closing bracket with no head before it makes the rest of the chunk literal text.
+    """
+    word_parts: list[str] = []
+    reading_parts: list[str] = []
+    start, bracket = 0, -1
+    literal, tied = False, False
+    for idx, char in enumerate(text):
+        if char == "[":
+            bracket = idx
+            close, reopen = text.find("]", idx + 1), text.find("[", idx + 1)
+            tied = close != -1 and (reopen == -1 or close < reopen)
+        elif char == "]":
+            tied = False
+            if literal:
+                continue
+            if bracket > start:
+                word_parts.append(text[start:bracket])
+                reading_parts.append(text[bracket + 1 : idx].replace(" ", MULTIPLE_READING_SEP))
+                start, bracket = idx + 1, -1
+            else:
+                literal = True
+        elif char.isspace() and not (tied and char == " "):
+            tail = text[start:idx].replace(" ", MULTIPLE_READING_SEP)
+            word_parts.append(tail)
+            reading_parts.append(tail)
+            start, bracket, literal = idx + 1, -1, False
+    tail = text[start:].replace(" ", MULTIPLE_READING_SEP)
+    word_parts.append(tail)
+    reading_parts.append(tail)
+    return "".join(word_parts), "".join(reading_parts)
+
+
 def word_reading(text: str) -> WordReading:
     """
     Takes furigana notation, splits it into (word, reading).
     """
-    word, reading = [], []
-    for split in map(decompose_word, whitespace_split(text)):
-        word.append(split.head + split.suffix)
-        reading.append(split.reading + split.suffix)
-    word, reading = "".join(word), "".join(reading)
+    word, reading = _parse_notation(text)
     return WordReading(word, reading) if (reading and word != reading) else WordReading(text, "")
 
 
@@ -139,6 +169,11 @@ def main():
 
     assert strip_non_jp_furigana("悪[わる][1223]い[2]") == "悪[わる]い"
 
+    assert find_head_reading_suffix("有[あ]り") == SplitFurigana(head="有", reading="あ", suffix="り")
+    assert find_head_reading_suffix("有[[あ]り") == SplitFurigana(head="有[", reading="あ", suffix="り")
+    assert find_head_reading_suffix("[あ]り") == NoFurigana("[あ]り")
+    assert find_head_reading_suffix("有]あ[り") == NoFurigana("有]あ[り")
+
     assert decompose_word("故郷[こきょう]") == SplitFurigana(head="故郷", reading="こきょう", suffix="")
     assert decompose_word("有[あ]り") == SplitFurigana(head="有", reading="あ", suffix="り")
     assert decompose_word("ひらがな") == SplitFurigana(head="ひらがな", reading="ひらがな", suffix="")
@@ -146,6 +181,8 @@ def main():
 
     assert word_reading("有[あ]り 得[う]る") == WordReading(word="有り得る", reading="ありうる")
     assert word_reading("有る") == WordReading(word="有る", reading="")
+    assert word_reading("故郷[こきょう ふるさと]") == WordReading(word="故郷", reading="こきょう・ふるさと")
+    assert word_reading("[あ]り 得[う]る") == WordReading(word="[あ]り得る", reading="[あ]りうる")
     assert word_reading("お 前[まい<br>まえ<br>めえ]") == WordReading(word="お前", reading="おまい<br>まえ<br>めえ")
     assert word_reading("もうお 金[かね]が 無[な]くなりました。") == WordReading(
         word="もうお金が無くなりました。", reading="もうおかねがなくなりました。"
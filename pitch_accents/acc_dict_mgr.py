@@ -3,7 +3,6 @@
 
 import collections
 import csv
-import pickle
 from typing import Optional
 
 from aqt import mw
@@ -11,10 +10,12 @@ from aqt.operations import QueryOp
 
 try:
     from .common import *
+    from .packed_accents import LazyAccentDict, write_packed_accents
     from .user_accents import UserAccentData
     from ..mecab_controller.kana_conv import to_katakana, to_hiragana
 except ImportError:
     from common import *
+    from packed_accents import LazyAccentDict, write_packed_accents
     from user_accents import UserAccentData
     from mecab_controller.kana_conv import to_katakana, to_hiragana
 
@@ -22,39 +23,43 @@ except ImportError:
 def read_formatted_accents() -> AccentDict:
     """
     Read the formatted pitch accents file to memory.
-    Place items in a list to retain the provided order of readings.
+    Place items in a dict to drop duplicates and retain the provided order of readings.
 
     Example entry as it appears in the formatted file:
     新年会 シンネンカイ <low_rise>シ</low_rise><high_drop>ンネ</high_drop><low>ンカイ</low> 3
     """
-    acc_dict: AccentDict = collections.defaultdict(list)
+    acc_dict: dict[str, dict[FormattedEntry, None]] = collections.defaultdict(dict)
+    # Many words share readings and notations. Keep one copy of each string.
+    intern_table: dict[str, str] = {}
     with open(FORMATTED_ACCENTS_TSV, newline="", encoding="utf-8") as f:
         reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
-        for word, kana, *pitch_data in reader:
-            entry = FormattedEntry(kana, *pitch_data)
+        for word, kana, html_notation, pitch_number in reader:
+            kana = intern_table.setdefault(kana, kana)
+            html_notation = intern_table.setdefault(html_notation, html_notation)
+            entry = FormattedEntry(kana, html_notation, pitch_number)
             for key in (word, kana):
-                if entry not in acc_dict[key]:
-                    acc_dict[key].append(entry)
+                acc_dict[key][entry] = None
     acc_dict = AccentDict({headword: tuple(entries) for headword, entries in acc_dict.items()})
     return acc_dict
 
 
-def accents_dict_init() -> AccentDict:
+def accents_dict_init() -> LazyAccentDict:
     if not os.path.isdir(RES_DIR_PATH):
         raise OSError("Pitch accents folder is missing!")
 
-    # If a pickle exists of the derivative file, use that.
-    # Otherwise, read from the derivative file and generate a pickle.
-    if should_regenerate(FORMATTED_ACCENTS_PICKLE):
-        print("The pickle needs updating.")
-        acc_dict = read_formatted_accents()
-        with open(FORMATTED_ACCENTS_PICKLE, "wb") as f:
-            # Pickle the dictionary using the highest protocol available.
-            pickle.dump(acc_dict, f, pickle.HIGHEST_PROTOCOL)
+    for legacy_cache in LEGACY_ACCENTS_CACHES:
+        if os.path.isfile(legacy_cache):
+            print(f"Removing outdated accents cache: {legacy_cache}")
+            os.remove(legacy_cache)
+
+    # If a cache exists of the derivative file, use that.
+    # Otherwise, read from the derivative file and generate a cache.
+    if should_regenerate(FORMATTED_ACCENTS_CACHE):
+        print("The accents cache needs updating.")
+        write_packed_accents(read_formatted_accents(), FORMATTED_ACCENTS_CACHE)
     else:
-        print("Reading from existing accents pickle.")
-        with open(FORMATTED_ACCENTS_PICKLE, "rb") as f:
-            acc_dict = pickle.load(f)
+        print("Reading from existing accents cache.")
+    acc_dict = LazyAccentDict.from_file(FORMATTED_ACCENTS_CACHE)
 
     # Finally, patch with user-defined entries.
     acc_dict.update(UserAccentData().create_formatted())
@@ -91,7 +96,7 @@ class AccentDictManager:
             "Reloading pitch accent dictionary...",
         ).run_in_background()
 
-    def _reload_dict(self, new_dict: AccentDict):
+    def _reload_dict(self, new_dict: LazyAccentDict):
         """Reloads accent db (e.g. when the user changed settings)."""
         print("Reloading accent dictionary...")
         self._db.clear()
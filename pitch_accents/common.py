@@ -37,7 +37,7 @@ def is_old(file_path: str) -> bool:
 
 def should_regenerate(file_path: str) -> bool:
     """
-    Return True if the pickle file pointed by file_path needs to be regenerated.
+    Return True if the cache file pointed by file_path needs to be regenerated.
     """
     return not os.path.isfile(file_path) or os.path.getsize(file_path) < 1 or is_old(file_path)
 
@@ -61,7 +61,7 @@ RE_PITCH_NUM = re.compile(r"\d+|\?")
 
 
 def split_pitch_numbers(s: str) -> list[str]:
-    return re.findall(RE_PITCH_NUM, s)
+    return RE_PITCH_NUM.findall(s)
 
 
 # Debug
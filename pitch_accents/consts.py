@@ -7,5 +7,10 @@ import os
 THIS_DIR_PATH = os.path.dirname(os.path.normpath(__file__))
 RES_DIR_PATH = os.path.join(THIS_DIR_PATH, "res")
 FORMATTED_ACCENTS_TSV = os.path.join(RES_DIR_PATH, "pitch_accents_formatted.csv")
-FORMATTED_ACCENTS_PICKLE = os.path.join(RES_DIR_PATH, "pitch_accents_formatted.pickle")
+FORMATTED_ACCENTS_CACHE = os.path.join(RES_DIR_PATH, "pitch_accents_formatted.bin")
+# Cache files used by older versions of the add-on. Removed on startup.
+LEGACY_ACCENTS_CACHES = (
+    os.path.join(RES_DIR_PATH, "pitch_accents_formatted.pickle"),
+    os.path.join(RES_DIR_PATH, "pitch_accents_formatted.marshal"),
+)
 NO_ACCENT = "?"
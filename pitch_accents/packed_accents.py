@@ -0,0 +1,157 @@
+# Copyright: Ren Tatsumoto <tatsu at autistici.org>
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+import array
+import struct
+from collections.abc import Iterator, Mapping, Sequence
+
+try:
+    from .common import AccentDict, FormattedEntry
+except ImportError:
+    from common import AccentDict, FormattedEntry
+
+# Layout of the packed file:
+# [u32 n_keys] [u32 key_offsets[n_keys + 1]] [u32 value_offsets[n_keys + 1]] [key bytes] [value bytes]
+# Keys are sorted, so a key can be found by binary search without decoding the others.
+# Each value holds the key's entries, one per line, with fields separated by tabs.
+# The file is a local cache, so offsets are stored in native byte order.
+HEADER = struct.Struct("I")
+OFFSET_TYPECODE = "I"
+SEP_FIELDS = "\t"
+SEP_ENTRIES = "\n"
+
+
+def pack_entries(entries: Sequence[FormattedEntry]) -> bytes:
+    return SEP_ENTRIES.join(SEP_FIELDS.join(entry) for entry in entries).encode("utf-8")
+
+
+def unpack_entries(blob: bytes) -> tuple[FormattedEntry, ...]:
+    return tuple(FormattedEntry(*line.split(SEP_FIELDS)) for line in blob.decode("utf-8").split(SEP_ENTRIES))
+
+
+def make_offsets(blobs: Sequence[bytes]) -> array.array:
+    offsets = array.array(OFFSET_TYPECODE, [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return offsets
+
+
+def write_packed_accents(acc_dict: AccentDict, file_path: str) -> None:
+    """Save the dictionary in the packed format."""
+    keys = sorted(acc_dict)
+    key_blobs = [key.encode("utf-8") for key in keys]
+    value_blobs = [pack_entries(acc_dict[key]) for key in keys]
+    with open(file_path, "wb") as f:
+        f.write(HEADER.pack(len(keys)))
+        f.write(make_offsets(key_blobs).tobytes())
+        f.write(make_offsets(value_blobs).tobytes())
+        f.write(b"".join(key_blobs))
+        f.write(b"".join(value_blobs))
+
+
+class LazyAccentDict(Mapping[str, Sequence[FormattedEntry]]):
+    """
+    Read-only view of a packed accents file.
+    Entries are decoded only when they are looked up.
+    Entries added with update() take precedence over the packed ones.
+    """
+
+    def __init__(self, data: bytes):
+        (self._n_keys,) = HEADER.unpack_from(data)
+        self._key_offsets = array.array(OFFSET_TYPECODE)
+        self._value_offsets = array.array(OFFSET_TYPECODE)
+        offsets_size = (self._n_keys + 1) * self._key_offsets.itemsize
+        pos = HEADER.size
+        self._key_offsets.frombytes(data[pos : pos + offsets_size])
+        pos += offsets_size
+        self._value_offsets.frombytes(data[pos : pos + offsets_size])
+        pos += offsets_size
+        self._keys = data[pos : pos + self._key_offsets[-1]]
+        pos += self._key_offsets[-1]
+        self._values = data[pos : pos + self._value_offsets[-1]]
+        self._overrides: dict[str, Sequence[FormattedEntry]] = {}
+
+    @classmethod
+    def from_file(cls, file_path: str):
+        with open(file_path, "rb") as f:
+            return cls(f.read())
+
+    def _key_at(self, idx: int) -> bytes:
+        return self._keys[self._key_offsets[idx] : self._key_offsets[idx + 1]]
+
+    def _find(self, key: str) -> int:
+        """Return the index of key in the packed file, or -1 if it's absent."""
+        target = key.encode("utf-8")
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._n_keys and self._key_at(lo) == target else -1
+
+    def __getitem__(self, key: str) -> Sequence[FormattedEntry]:
+        try:
+            return self._overrides[key]
+        except KeyError:
+            pass
+        if (idx := self._find(key)) < 0:
+            raise KeyError(key)
+        return unpack_entries(self._values[self._value_offsets[idx] : self._value_offsets[idx + 1]])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._overrides or (isinstance(key, str) and self._find(key) >= 0)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._overrides
+        for idx in range(self._n_keys):
+            if (key := self._key_at(idx).decode("utf-8")) not in self._overrides:
+                yield key
+
+    def __len__(self) -> int:
+        return self._n_keys + sum(self._find(key) < 0 for key in self._overrides)
+
+    def update(self, other: Mapping[str, Sequence[FormattedEntry]]) -> None:
+        self._overrides.update(other)
+
+    def clear(self) -> None:
+        self._n_keys = 0
+        self._key_offsets = array.array(OFFSET_TYPECODE, [0])
+        self._value_offsets = array.array(OFFSET_TYPECODE, [0])
+        self._keys = self._values = b""
+        self._overrides.clear()
+
+
+# Debug
+##########################################################################
+
+
+def main():
+    import os
+    import tempfile
+
+    acc_dict = AccentDict(
+        {
+            "新年会": (FormattedEntry("シンネンカイ", "<low_rise>シ</low_rise><high_drop>ンネ</high_drop>", "3"),),
+            "納屋": (FormattedEntry("ナヤ", "<high>ナヤ</high>", "0"), FormattedEntry("ナヤ", "<low>ナヤ</low>", "1")),
+            "ナヤ": (FormattedEntry("ナヤ", "<high>ナヤ</high>", "0"),),
+        }
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "packed.bin")
+        write_packed_accents(acc_dict, file_path)
+        packed = LazyAccentDict.from_file(file_path)
+
+    assert len(packed) == 3
+    assert dict(packed) == acc_dict
+    assert "納屋" in packed and "無い" not in packed
+    packed.update({"無い": (FormattedEntry("ナイ", "<high_drop>ナ</high_drop><low>イ</low>", "1"),)})
+    assert "無い" in packed and len(packed) == 4
+    packed.clear()
+    assert len(packed) == 0 and "納屋" not in packed
+    print("Passed.")
+
+
+if __name__ == "__main__":
+    main()